@@ -1,24 +1,186 @@
-from fastapi import FastAPI, Query, HTTPException, BackgroundTasks
-from fastapi.responses import JSONResponse, FileResponse
+from fastapi import FastAPI, Query, HTTPException, Request, Response
+from fastapi.responses import ORJSONResponse, FileResponse, StreamingResponse
 from pydantic import BaseModel
 from typing import List, Dict, Any, Optional
+import asyncio
+import concurrent.futures
+import hashlib
+import json
 import os
+import threading
 import logging
+import aiofiles
+import anyio.to_thread
+from cachetools import TTLCache
+
+try:
+    import redis
+except ImportError:
+    redis = None
+from contextlib import asynccontextmanager
 from utils import process_company_news
 
 # Set up logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+def warm_worker():
+    """
+    Build the sentiment pipeline inside a pool worker so the model is
+    resident before the first real analysis.
+    """
+    import utils
+    utils.get_sentiment_analyzer()
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    global main_loop, executor, redis_client, redis_listener
+    main_loop = asyncio.get_running_loop()
+    # Each pool process holds a full copy of the sentiment model, and under
+    # gunicorn every web worker builds its own pool - keep it small so the
+    # total process count stays bounded (see gunicorn.conf.py)
+    pool_workers = int(os.environ.get("ANALYSIS_POOL_WORKERS", "2"))
+    executor = concurrent.futures.ProcessPoolExecutor(max_workers=pool_workers)
+    # Spin the workers up now so the first /analyze doesn't pay model load
+    for _ in range(pool_workers):
+        executor.submit(warm_worker)
+    # Raise the anyio worker-thread cap for any remaining IO-bound endpoints
+    anyio.to_thread.current_default_thread_limiter().total_tokens = 64
+
+    # Connect the shared L2 cache tier; without it each gunicorn worker
+    # only sees its own in-process results
+    if redis is not None and REDIS_URL:
+        try:
+            redis_client = redis.Redis.from_url(
+                REDIS_URL,
+                decode_responses=True,
+                socket_connect_timeout=2,
+                socket_timeout=2
+            )
+            redis_client.ping()
+            redis_listener = asyncio.create_task(watch_redis_updates())
+            logger.info(f"Connected to Redis cache at {REDIS_URL}")
+        except Exception as e:
+            logger.warning(f"Redis unavailable, using in-process cache only: {str(e)}")
+            redis_client = None
+
+    yield
+
+    if redis_listener is not None:
+        redis_listener.cancel()
+    executor.shutdown(wait=False)
+
 # Create FastAPI app
 app = FastAPI(
     title="News Analyzer API",
     description="API for company news analysis and sentiment reporting with Hindi TTS",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse
 )
 
-# Cache to store results (simple in-memory cache)
-results_cache = {}
+# Cache to store results - bounded LRU with per-entry TTL so memory stays
+# flat under sustained traffic and stale reports expire after an hour.
+# Keyed by canonicalized (lowercase) company name so reads are a single
+# dict hit; num_articles is stored inside the entry.
+CACHE_MAX_ENTRIES = 256
+CACHE_TTL_SECONDS = 3600
+results_cache = TTLCache(maxsize=CACHE_MAX_ENTRIES, ttl=CACHE_TTL_SECONDS)
+cache_lock = threading.Lock()
+
+def cache_key_for(company_name: str) -> str:
+    """Canonicalize a company name into its cache key."""
+    return company_name.strip().lower()
+
+# Shared Redis L2 tier: the in-process TTLCache holds hot companies while
+# Redis holds the long tail and keeps multi-worker deployments coherent.
+# Workers announce finished analyses on a pub/sub channel so peers can
+# refresh their L1 and wake SSE subscribers.
+REDIS_URL = os.environ.get("REDIS_URL")
+REDIS_KEY_PREFIX = "news:"
+REDIS_CHANNEL = "news-updates"
+redis_client = None
+redis_listener: Optional["asyncio.Task"] = None
+
+async def l2_store(cache_key: str, entry: Dict[str, Any]):
+    """Write a cache entry to the Redis tier and announce it to peers.
+
+    The sync client's network round-trips run on a worker thread so a
+    slow or stalled Redis never blocks the event loop.
+    """
+    if redis_client is None:
+        return
+
+    def _write():
+        redis_client.setex(REDIS_KEY_PREFIX + cache_key, CACHE_TTL_SECONDS, json.dumps(entry, default=str))
+        redis_client.publish(REDIS_CHANNEL, cache_key)
+
+    try:
+        await anyio.to_thread.run_sync(_write)
+    except Exception as e:
+        logger.error(f"Error writing to Redis cache: {str(e)}")
+
+async def l2_load(cache_key: str) -> Optional[Dict[str, Any]]:
+    """Read a cache entry from the Redis tier, off the event loop."""
+    if redis_client is None:
+        return None
+    try:
+        payload = await anyio.to_thread.run_sync(redis_client.get, REDIS_KEY_PREFIX + cache_key)
+        return json.loads(payload) if payload else None
+    except Exception as e:
+        logger.error(f"Error reading from Redis cache: {str(e)}")
+        return None
+
+async def lookup_cached(cache_key: str) -> Optional[Dict[str, Any]]:
+    """Look up a cache entry, promoting L2 hits into the in-process L1."""
+    with cache_lock:
+        cached = results_cache.get(cache_key)
+    if cached is None:
+        cached = await l2_load(cache_key)
+        if cached is not None:
+            with cache_lock:
+                results_cache[cache_key] = cached
+    return cached
+
+async def watch_redis_updates():
+    """Refresh L1 and wake SSE subscribers when peers publish results."""
+    pubsub = redis_client.pubsub()
+    pubsub.subscribe(REDIS_CHANNEL)
+    while True:
+        message = await anyio.to_thread.run_sync(
+            lambda: pubsub.get_message(ignore_subscribe_messages=True, timeout=1.0)
+        )
+        if message and message.get("type") == "message":
+            cache_key = message["data"]
+            entry = await l2_load(cache_key)
+            if entry is not None:
+                with cache_lock:
+                    results_cache[cache_key] = entry
+            notify_completion(cache_key)
+
+# Events used to push completion to SSE subscribers, keyed by cache key.
+# Background processing runs in a worker thread, so completion is signalled
+# onto the main event loop via call_soon_threadsafe.
+completion_events: Dict[str, asyncio.Event] = {}
+main_loop: Optional[asyncio.AbstractEventLoop] = None
+STREAM_TIMEOUT_SECONDS = 120
+
+# Process pool for the heavy analysis work (scraping, sentiment, TTS).
+# BackgroundTasks runs on Starlette's anyio thread pool, which caps out at
+# 8 concurrent tasks and is GIL-bound for the CPU-heavy sentiment step;
+# separate processes scale with the core count instead.
+executor: Optional[concurrent.futures.ProcessPoolExecutor] = None
+
+# In-flight analyses keyed by cache key so concurrent identical requests
+# share a single computation instead of scraping and inferring twice
+pending: Dict[str, asyncio.Future] = {}
+pending_lock = asyncio.Lock()
+
+def notify_completion(cache_key: str):
+    """Wake any SSE subscribers waiting on this cache key."""
+    event = completion_events.pop(cache_key, None)
+    if event is not None and main_loop is not None:
+        main_loop.call_soon_threadsafe(event.set)
 
 class CompanyRequest(BaseModel):
     company_name: str
@@ -44,65 +206,186 @@ async def root():
     return {"message": "News Analyzer API is running"}
 
 @app.post("/analyze", response_model=Dict[str, Any])
-async def analyze_company(request: CompanyRequest, background_tasks: BackgroundTasks):
+async def analyze_company(request: CompanyRequest):
     """
     Analyze news for a specific company.
-    Returns basic response immediately and processes full analysis in background.
+    Returns basic response immediately and processes full analysis in a
+    worker process.
     """
     company_name = request.company_name
     num_articles = request.num_articles
     
     # Check cache
-    cache_key = f"{company_name}_{num_articles}"
-    if cache_key in results_cache:
+    cache_key = cache_key_for(company_name)
+    cached = await lookup_cached(cache_key)
+    if cached is not None and cached["num_articles"] >= num_articles:
         logger.info(f"Returning cached results for {company_name}")
-        return results_cache[cache_key]
+        return cached["result"]
     
-    # Return immediate response and process in background
-    response = {
+    # Single-flight: if an identical analysis is already running, piggyback
+    # on it rather than scheduling a duplicate
+    async with pending_lock:
+        if cache_key in pending:
+            logger.info(f"Joining in-flight analysis for {company_name}")
+            return {
+                "status": "processing",
+                "message": f"Analysis for {company_name} already in progress. Check /results/{company_name} for results.",
+                "company": company_name,
+                "shared": True
+            }
+
+        # Dispatch to the process pool; the callback caches the result on
+        # the event loop thread once the worker finishes
+        loop = asyncio.get_running_loop()
+        future = loop.run_in_executor(executor, process_company_news, company_name, num_articles)
+        pending[cache_key] = future
+        future.add_done_callback(
+            lambda fut: store_result(company_name, num_articles, fut)
+        )
+
+    return {
         "status": "processing",
         "message": f"Analysis for {company_name} started. Check /results/{company_name} for results.",
         "company": company_name
     }
-    
-    # Add task to background
-    background_tasks.add_task(process_and_cache_results, company_name, num_articles)
-    
-    return response
 
-@app.get("/results/{company_name}")
-async def get_results(company_name: str):
+@app.get("/results/{company_name}", response_model=None)
+async def get_results(company_name: str, request: Request):
     """
     Get the analysis results for a specific company.
+    Repeat requests carrying a matching If-None-Match get an empty 304
+    instead of the full multi-KB payload.
     """
-    # Check if results exist for any cache key with this company name
-    for key in results_cache:
-        if key.startswith(company_name + "_"):
-            return results_cache[key]
-    
+    cached = await lookup_cached(cache_key_for(company_name))
+    if cached is not None:
+        etag = cached.get("etag")
+        if etag and request.headers.get("if-none-match") == etag:
+            return Response(status_code=304)
+        headers = {"etag": etag} if etag else None
+        # Data in the cache already conforms - serialize it directly with
+        # orjson rather than revalidating per-article models on each hit
+        return ORJSONResponse(cached["result"], headers=headers)
+
     # If no results found
     raise HTTPException(status_code=404, detail=f"No results found for {company_name}. Analysis may still be processing.")
 
+@app.get("/stream/{company_name}")
+async def stream_results(company_name: str):
+    """
+    Push the analysis result for a company over Server-Sent Events.
+    Sends a single data event as soon as processing completes, so clients
+    don't have to poll /results.
+    """
+    cache_key = cache_key_for(company_name)
+
+    async def event_stream():
+        # Check both cache tiers before parking: if a peer already finished
+        # this analysis, the completion publish happened long ago and no
+        # further event will ever wake this subscriber
+        cached = await lookup_cached(cache_key)
+
+        if cached is None:
+            event = completion_events.setdefault(cache_key, asyncio.Event())
+            try:
+                await asyncio.wait_for(event.wait(), timeout=STREAM_TIMEOUT_SECONDS)
+            except asyncio.TimeoutError:
+                yield "event: timeout\ndata: {}\n\n"
+                return
+            with cache_lock:
+                cached = results_cache.get(cache_key)
+
+        payload = json.dumps(cached["result"]) if cached else "{}"
+        yield f"data: {payload}\n\n"
+
+    return StreamingResponse(event_stream(), media_type="text/event-stream")
+
+# Chunk size for streaming audio and the threshold below which a plain
+# FileResponse (sendfile) is cheaper than a chunked stream
+AUDIO_CHUNK_SIZE = 64 * 1024
+SMALL_AUDIO_BYTES = 256 * 1024
+
 @app.get("/audio/{company_name}")
-async def get_audio(company_name: str):
+async def get_audio(company_name: str, request: Request):
     """
     Get the Hindi TTS audio file for a company analysis.
+    Streams in 64KB chunks and honors Range headers so the HTML5 audio
+    player can seek without the server buffering the whole file.
     """
-    # Find the cache key for this company
+    # Find the cached result for this company
     audio_file = None
-    for key in results_cache:
-        if key.startswith(company_name + "_"):
-            if "Audio" in results_cache[key] and results_cache[key]["Audio"]:
-                audio_file = results_cache[key]["Audio"]
-                break
-    
+    cached = await lookup_cached(cache_key_for(company_name))
+    if cached is not None:
+        audio_file = cached["result"].get("Audio")
+
     if not audio_file or not os.path.exists(audio_file):
         raise HTTPException(status_code=404, detail=f"No audio file found for {company_name}")
-    
-    return FileResponse(
-        path=audio_file, 
-        media_type="audio/mpeg", 
-        filename=f"{company_name}_analysis.mp3"
+
+    file_size = os.stat(audio_file).st_size
+    range_header = request.headers.get("range")
+
+    # Small files without a Range request go through sendfile directly
+    if file_size < SMALL_AUDIO_BYTES and not range_header:
+        return FileResponse(
+            path=audio_file,
+            media_type="audio/mpeg",
+            filename=f"{company_name}_analysis.mp3"
+        )
+
+    # Parse the requested byte range, defaulting to the whole file.
+    # Handles both forms from RFC 7233: "start-[end]" and the suffix
+    # form "-N" (last N bytes). Malformed headers fall back to a full 200.
+    start, end = 0, file_size - 1
+    status_code = 200
+    if range_header and range_header.startswith("bytes="):
+        range_spec = range_header[len("bytes="):].split("-", 1)
+        try:
+            if range_spec[0]:
+                start = int(range_spec[0])
+                if len(range_spec) > 1 and range_spec[1]:
+                    end = min(int(range_spec[1]), file_size - 1)
+            elif len(range_spec) > 1 and range_spec[1]:
+                # Suffix form: the last N bytes of the file
+                start = max(file_size - int(range_spec[1]), 0)
+            else:
+                raise ValueError("empty range spec")
+            if end < start:
+                # Reversed range, e.g. bytes=500-100; RFC 9110 says to
+                # ignore the header, so fall back to the full 200
+                raise ValueError("reversed range")
+            if start >= file_size:
+                # Unsatisfiable - nothing at or past EOF to serve
+                return Response(
+                    status_code=416,
+                    headers={"content-range": f"bytes */{file_size}"}
+                )
+            status_code = 206
+        except ValueError:
+            start, end = 0, file_size - 1
+
+    async def stream_audio():
+        async with aiofiles.open(audio_file, "rb") as f:
+            await f.seek(start)
+            remaining = end - start + 1
+            while remaining > 0:
+                chunk = await f.read(min(AUDIO_CHUNK_SIZE, remaining))
+                if not chunk:
+                    break
+                remaining -= len(chunk)
+                yield chunk
+
+    headers = {
+        "accept-ranges": "bytes",
+        "content-length": str(end - start + 1),
+        "content-disposition": f'attachment; filename="{company_name}_analysis.mp3"'
+    }
+    if status_code == 206:
+        headers["content-range"] = f"bytes {start}-{end}/{file_size}"
+
+    return StreamingResponse(
+        stream_audio(),
+        status_code=status_code,
+        media_type="audio/mpeg",
+        headers=headers
     )
 
 @app.get("/companies")
@@ -110,37 +393,53 @@ async def get_companies():
     """
     Get list of companies that have been analyzed.
     """
-    companies = set()
-    for key in results_cache:
-        company_name = key.split("_")[0]
-        companies.add(company_name)
-    
-    return {"companies": list(companies)}
+    # A direct snapshot - no per-key string splitting. TTLCache drops
+    # expired keys on access, which keeps this view exact without a
+    # parallel index to maintain. Each entry carries the name as the user
+    # typed it, since cache keys are lowercased for lookup.
+    with cache_lock:
+        companies = [
+            entry.get("display_name", key)
+            for key, entry in results_cache.items()
+        ]
+
+    return {"companies": companies}
 
-def process_and_cache_results(company_name: str, num_articles: int):
+def store_result(company_name: str, num_articles: int, future: "asyncio.Future"):
     """
-    Process company news and cache results.
+    Cache a finished analysis and wake any SSE subscribers.
+    Runs as a done-callback once the worker process returns.
     """
     try:
-        logger.info(f"Starting background processing for {company_name}")
-        
-        # Process company news
-        result = process_company_news(company_name, num_articles)
-        
-        # Cache results
-        cache_key = f"{company_name}_{num_articles}"
-        results_cache[cache_key] = result
-        
+        result = future.result()
         logger.info(f"Completed processing for {company_name}")
-    
     except Exception as e:
         logger.error(f"Error in background processing for {company_name}: {str(e)}")
-        # Cache error result
-        results_cache[f"{company_name}_{num_articles}"] = {
+        result = {
             "status": "error",
             "message": f"Error processing analysis for {company_name}: {str(e)}",
             "company": company_name
         }
+
+    # Cache results (TTLCache evicts the least recently used entry on insert)
+    etag = hashlib.md5(json.dumps(result, sort_keys=True, default=str).encode()).hexdigest()
+    entry = {
+        "num_articles": num_articles,
+        "result": result,
+        "etag": etag,
+        # As the user typed it; cache keys are lowercased
+        "display_name": company_name
+    }
+    with cache_lock:
+        results_cache[cache_key_for(company_name)] = entry
+    # This callback runs on the event loop thread - schedule the Redis
+    # write as a task so its round-trips happen off-loop
+    if main_loop is not None:
+        main_loop.create_task(l2_store(cache_key_for(company_name), entry))
+    pending.pop(cache_key_for(company_name), None)
+    notify_completion(cache_key_for(company_name))
 if __name__ == "__main__":
+    # Local development only - production uses gunicorn with
+    # UvicornWorker processes (see gunicorn.conf.py)
     import uvicorn
     uvicorn.run(app, host="0.0.0.0", port=8000)
\ No newline at end of file
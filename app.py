@@ -1,8 +1,8 @@
 import streamlit as st
 import requests
-import pandas as pd
+from requests.adapters import HTTPAdapter
 import time
-import json
+import orjson
 import os
 import base64
 from typing import Dict, Any, List
@@ -16,12 +16,28 @@ logger = logging.getLogger(__name__)
 API_URL = "http://localhost:8000"  # Local development
 # API_URL = "https://your-app-name.hf.space" # Hugging Face Spaces
 
+# Shared session so API calls reuse pooled keep-alive connections instead
+# of paying a TCP (and TLS) handshake per request
+SESSION = requests.Session()
+SESSION.mount("http://", HTTPAdapter(pool_connections=10, pool_maxsize=20))
+SESSION.mount("https://", HTTPAdapter(pool_connections=10, pool_maxsize=20))
+SESSION.headers["Connection"] = "keep-alive"
+
+# Template for per-article topic tags, kept at module level so the CSS
+# string is built once rather than on every rerun
+TOPIC_TEMPLATE = "<span style='background-color:#f0f2f6;padding:2px 8px;margin:0 4px;border-radius:10px;font-size:0.8em'>{0}</span>"
+
+def decode_json(response: requests.Response) -> Dict[str, Any]:
+    """Decode a response body with orjson (much faster than stdlib json)"""
+    return orjson.loads(response.content)
+
+@st.cache_data(ttl=30)
 def get_companies() -> List[str]:
-    """Get list of analyzed companies from API"""
+    """Get list of analyzed companies from API (cached across reruns)"""
     try:
-        response = requests.get(f"{API_URL}/companies")
+        response = SESSION.get(f"{API_URL}/companies")
         if response.status_code == 200:
-            return response.json().get("companies", [])
+            return decode_json(response).get("companies", [])
         return []
     except Exception as e:
         logger.error(f"Error fetching companies: {str(e)}")
@@ -30,26 +46,72 @@ def get_companies() -> List[str]:
 def submit_analysis_request(company_name: str, num_articles: int) -> Dict[str, Any]:
     """Submit analysis request to API"""
     try:
-        response = requests.post(
+        response = SESSION.post(
             f"{API_URL}/analyze",
             json={"company_name": company_name, "num_articles": num_articles}
         )
-        return response.json()
+        return decode_json(response)
     except Exception as e:
         logger.error(f"Error submitting analysis: {str(e)}")
         return {"status": "error", "message": f"API error: {str(e)}"}
 
-def get_analysis_results(company_name: str) -> Dict[str, Any]:
-    """Get analysis results from API"""
+# Last seen ETag and payload per company, so repeat fetches revalidate
+# with If-None-Match and reuse the cached body on a 304
+_etags: Dict[str, str] = {}
+_last_results: Dict[str, Dict[str, Any]] = {}
+
+def _fetch_results(company_name: str) -> Dict[str, Any]:
+    """Fetch analysis results from the API with ETag revalidation"""
     try:
-        response = requests.get(f"{API_URL}/results/{company_name}")
+        headers = {}
+        if company_name in _etags:
+            headers["If-None-Match"] = _etags[company_name]
+        response = SESSION.get(f"{API_URL}/results/{company_name}", headers=headers)
+        if response.status_code == 304:
+            return _last_results.get(company_name, {})
         if response.status_code == 200:
-            return response.json()
+            results = decode_json(response)
+            if "ETag" in response.headers:
+                _etags[company_name] = response.headers["ETag"]
+                _last_results[company_name] = results
+            return results
         return {"status": "error", "message": f"Error: {response.status_code}"}
     except Exception as e:
         logger.error(f"Error fetching results: {str(e)}")
         return {"status": "error", "message": f"API error: {str(e)}"}
 
+@st.cache_data(ttl=60, show_spinner=False)
+def get_analysis_results(company_name: str) -> Dict[str, Any]:
+    """Get analysis results from API (cached across reruns)"""
+    return _fetch_results(company_name)
+
+def poll_analysis_results(company_name: str, timeout: float = 60.0) -> Dict[str, Any]:
+    """
+    Poll for results with exponential backoff (0.25s doubling to a 4s cap)
+    until articles arrive or the timeout expires
+    """
+    delay = 0.25
+    start = time.time()
+    while time.time() - start < timeout:
+        results = _fetch_results(company_name)
+        if "Articles" in results and results["Articles"]:
+            return results
+        time.sleep(delay)
+        delay = min(delay * 2, 4.0)
+    return _fetch_results(company_name)
+
+def stream_analysis_result(company_name: str, timeout: int = 120) -> Dict[str, Any]:
+    """Wait for the analysis result over the API's SSE stream"""
+    try:
+        with SESSION.get(f"{API_URL}/stream/{company_name}", stream=True, timeout=timeout) as response:
+            for line in response.iter_lines(decode_unicode=True):
+                if line and line.startswith("data: "):
+                    return orjson.loads(line[len("data: "):])
+        return {}
+    except Exception as e:
+        logger.error(f"Error streaming results: {str(e)}")
+        return {"status": "error", "message": f"API error: {str(e)}"}
+
 def get_audio_url(company_name: str) -> str:
     """Get URL for audio file"""
     return f"{API_URL}/audio/{company_name}"
@@ -65,13 +127,17 @@ def autoplay_audio(file_url: str) -> str:
     return audio_html
 
 def create_sentiment_chart(sentiment_dist: Dict[str, int]) -> None:
-    """Create sentiment distribution chart"""
-    df = pd.DataFrame({
-        'Sentiment': list(sentiment_dist.keys()),
-        'Count': list(sentiment_dist.values())
-    })
-    
-    st.bar_chart(df.set_index('Sentiment'))
+    """Create sentiment distribution chart from a static Vega-Lite spec"""
+    st.vega_lite_chart({
+        "data": {
+            "values": [{"Sentiment": k, "Count": v} for k, v in sentiment_dist.items()]
+        },
+        "mark": "bar",
+        "encoding": {
+            "x": {"field": "Sentiment", "type": "nominal"},
+            "y": {"field": "Count", "type": "quantitative"}
+        }
+    }, use_container_width=True)
 
 def main():
     st.set_page_config(
@@ -120,39 +186,26 @@ def main():
                 response = submit_analysis_request(company_name, num_articles)
                 
                 if response.get("status") == "processing":
-                    st.success(f"Analysis for {company_name} started! Results will appear shortly...")
-                    
-                    # Set up progress bar
-                    progress_bar = st.progress(0)
-                    status_text = st.empty()
-                    
-                    # Poll for results
-                    for i in range(1, 101):
-                        # Update progress bar
-                        progress_bar.progress(i)
-                        
-                        # Check if results are ready
-                        if i % 10 == 0:  # Check every 10%
-                            status_text.text(f"Processing... ({i}%)")
-                            results = get_analysis_results(company_name)
-                            
-                            if "Articles" in results and results["Articles"]:
-                                progress_bar.progress(100)
-                                status_text.text("Analysis complete!")
-                                display_results(company_name, results)
-                                break
-                        
-                        # Wait before next update
-                        time.sleep(0.5)
-                    
-                    # Final check if loop completed
-                    if i >= 100:
-                        results = get_analysis_results(company_name)
+                    with st.status(f"Analyzing news for {company_name}...") as status:
+                        # Wait for the server to push the result over SSE
+                        # instead of polling /results on a timer
+                        results = stream_analysis_result(company_name)
+
+                        if "Articles" not in results or not results["Articles"]:
+                            # Stream may have timed out - fall back to
+                            # polling with exponential backoff
+                            results = poll_analysis_results(company_name)
+
                         if "Articles" in results and results["Articles"]:
-                            display_results(company_name, results)
+                            status.update(label="Analysis complete!", state="complete")
                         else:
-                            st.warning("Analysis is taking longer than expected. Please check back later or try again.")
-                
+                            status.update(label="Analysis still processing...", state="error")
+
+                    if "Articles" in results and results["Articles"]:
+                        display_results(company_name, results)
+                    else:
+                        st.warning("Analysis is taking longer than expected. Please check back later or try again.")
+
                 else:
                     st.error(f"Error: {response.get('message', 'Unknown error')}")
     
@@ -172,110 +225,138 @@ def display_results(company_name: str, results: Dict[str, Any]) -> None:
     if "Articles" not in results or not results["Articles"]:
         st.warning(f"No articles found for {company_name} or analysis still processing.")
         return
-    
+
+    # Precompute topic tag HTML once per article so reruns just emit the
+    # cached string instead of reformatting every tag
+    for article in results["Articles"]:
+        if "_topic_html" not in article:
+            article["_topic_html"] = "".join(
+                TOPIC_TEMPLATE.format(topic) for topic in article["Topics"]
+            )
+
     # Display company header
     st.header(f"📊 Analysis Results for {company_name}")
-    
-    # Create tabs for different views
+
+    # Create tabs for different views; each body is an st.fragment so
+    # interacting inside one tab reruns only that tab's renderer
     tab1, tab2, tab3, tab4 = st.tabs(["Summary", "Articles", "Comparative Analysis", "Hindi Summary"])
-    
+
     with tab1:
-        st.subheader("Overall Sentiment Analysis")
-        
-        # Show final sentiment analysis
-        if "Final Sentiment Analysis" in results:
-            st.info(results["Final Sentiment Analysis"])
-        
-        # Show sentiment distribution chart
-        if "Comparative Sentiment Score" in results and "Sentiment Distribution" in results["Comparative Sentiment Score"]:
-            sentiment_dist = results["Comparative Sentiment Score"]["Sentiment Distribution"]
-            create_sentiment_chart(sentiment_dist)
-        
-        # Show common topics
-        if "Comparative Sentiment Score" in results and "Common Topics" in results["Comparative Sentiment Score"]:
-            common_topics = results["Comparative Sentiment Score"]["Common Topics"]
-            st.subheader("Common Topics")
-            for topic in common_topics:
-                st.markdown(f"- {topic}")
-    
+        render_summary(results)
+
     with tab2:
-        st.subheader("Articles Analyzed")
-        
-        # Display each article
-        for i, article in enumerate(results["Articles"]):
-            with st.expander(f"{i+1}. {article['Title']}"):
-                # Color-code sentiment
-                sentiment_color = {
-                    "Positive": "green",
-                    "Negative": "red",
-                    "Neutral": "gray"
-                }.get(article["Sentiment"], "black")
-                
-                st.markdown(f"**Sentiment:** <span style='color:{sentiment_color}'>{article['Sentiment']}</span>", unsafe_allow_html=True)
-                st.markdown(f"**Summary:** {article['Summary']}")
-                
-                # Display topics as tags
-                st.markdown("**Topics:**")
-                topic_html = " ".join([f"<span style='background-color:#f0f2f6;padding:2px 8px;margin:0 4px;border-radius:10px;font-size:0.8em'>{topic}</span>" for topic in article["Topics"]])
-                st.markdown(topic_html, unsafe_allow_html=True)
-                
-                if "URL" in article:
-                    st.markdown(f"[Read full article]({article['URL']})")
-    
+        render_articles(results)
+
     with tab3:
-        st.subheader("Comparative Analysis")
-        
-        if "Comparative Sentiment Score" in results:
-            comp_analysis = results["Comparative Sentiment Score"]
-            
-            # Display coverage differences
-            if "Coverage Differences" in comp_analysis:
-                st.markdown("### Key Differences in Coverage")
-                for i, diff in enumerate(comp_analysis["Coverage Differences"]):
-                    with st.expander(f"Insight {i+1}: {diff.get('Comparison', '')[:50]}..."):
-                        st.markdown(f"**Comparison:** {diff.get('Comparison', '')}")
-                        st.markdown(f"**Impact:** {diff.get('Impact', '')}")
-            
-            # Display sentiment distribution
-            if "Sentiment Distribution" in comp_analysis:
-                st.markdown("### Sentiment Distribution")
-                sentiment_dist = comp_analysis["Sentiment Distribution"]
-                
-                # Show as chart
-                create_sentiment_chart(sentiment_dist)
-                
-                # Show as text
-                col1, col2, col3 = st.columns(3)
-                with col1:
-                    st.metric("Positive", sentiment_dist.get("Positive", 0))
-                with col2:
-                    st.metric("Neutral", sentiment_dist.get("Neutral", 0))
-                with col3:
-                    st.metric("Negative", sentiment_dist.get("Negative", 0))
-            
-            # Display common topics
-            if "Common Topics" in comp_analysis:
-                st.markdown("### Common Topics Across Articles")
-                common_topics = comp_analysis["Common Topics"]
-                
-                # Display as tags
-                topic_html = " ".join([f"<span style='background-color:#f0f2f6;padding:4px 10px;margin:0 6px;border-radius:10px'>{topic}</span>" for topic in common_topics])
-                st.markdown(topic_html, unsafe_allow_html=True)
-    
+        render_comparative(results)
+
     with tab4:
-        st.subheader("Hindi Summary and Audio")
-        
-        # Display Hindi summary
-        if "Hindi Summary" in results:
-            st.markdown("### Hindi Text Summary")
-            st.text(results["Hindi Summary"])
-        
-        # Display audio player
-        if "Audio" in results and results["Audio"]:
-            st.markdown("### Hindi Audio Summary")
-            audio_url = get_audio_url(company_name)
-            st.markdown(autoplay_audio(audio_url), unsafe_allow_html=True)
-            st.markdown(f"[Download Audio]({audio_url})")
+        render_hindi_summary(company_name, results)
+
+@st.fragment
+def render_summary(results: Dict[str, Any]) -> None:
+    """Render the overall sentiment summary tab"""
+    st.subheader("Overall Sentiment Analysis")
+
+    # Show final sentiment analysis
+    if "Final Sentiment Analysis" in results:
+        st.info(results["Final Sentiment Analysis"])
+
+    # Show sentiment distribution chart
+    if "Comparative Sentiment Score" in results and "Sentiment Distribution" in results["Comparative Sentiment Score"]:
+        sentiment_dist = results["Comparative Sentiment Score"]["Sentiment Distribution"]
+        create_sentiment_chart(sentiment_dist)
+
+    # Show common topics
+    if "Comparative Sentiment Score" in results and "Common Topics" in results["Comparative Sentiment Score"]:
+        common_topics = results["Comparative Sentiment Score"]["Common Topics"]
+        st.subheader("Common Topics")
+        for topic in common_topics:
+            st.markdown(f"- {topic}")
+
+@st.fragment
+def render_articles(results: Dict[str, Any]) -> None:
+    """Render the per-article breakdown tab"""
+    st.subheader("Articles Analyzed")
+
+    # Display each article
+    for i, article in enumerate(results["Articles"]):
+        with st.expander(f"{i+1}. {article['Title']}"):
+            # Color-code sentiment
+            sentiment_color = {
+                "Positive": "green",
+                "Negative": "red",
+                "Neutral": "gray"
+            }.get(article["Sentiment"], "black")
+
+            st.markdown(f"**Sentiment:** <span style='color:{sentiment_color}'>{article['Sentiment']}</span>", unsafe_allow_html=True)
+            st.markdown(f"**Summary:** {article['Summary']}")
+
+            # Display topics as tags
+            st.markdown("**Topics:**")
+            st.markdown(article["_topic_html"], unsafe_allow_html=True)
+
+            if "URL" in article:
+                st.markdown(f"[Read full article]({article['URL']})")
+
+@st.fragment
+def render_comparative(results: Dict[str, Any]) -> None:
+    """Render the comparative analysis tab"""
+    st.subheader("Comparative Analysis")
+
+    if "Comparative Sentiment Score" in results:
+        comp_analysis = results["Comparative Sentiment Score"]
+
+        # Display coverage differences
+        if "Coverage Differences" in comp_analysis:
+            st.markdown("### Key Differences in Coverage")
+            for i, diff in enumerate(comp_analysis["Coverage Differences"]):
+                with st.expander(f"Insight {i+1}: {diff.get('Comparison', '')[:50]}..."):
+                    st.markdown(f"**Comparison:** {diff.get('Comparison', '')}")
+                    st.markdown(f"**Impact:** {diff.get('Impact', '')}")
+
+        # Display sentiment distribution
+        if "Sentiment Distribution" in comp_analysis:
+            st.markdown("### Sentiment Distribution")
+            sentiment_dist = comp_analysis["Sentiment Distribution"]
+
+            # Show as chart
+            create_sentiment_chart(sentiment_dist)
+
+            # Show as text
+            col1, col2, col3 = st.columns(3)
+            with col1:
+                st.metric("Positive", sentiment_dist.get("Positive", 0))
+            with col2:
+                st.metric("Neutral", sentiment_dist.get("Neutral", 0))
+            with col3:
+                st.metric("Negative", sentiment_dist.get("Negative", 0))
+
+        # Display common topics
+        if "Common Topics" in comp_analysis:
+            st.markdown("### Common Topics Across Articles")
+            common_topics = comp_analysis["Common Topics"]
+
+            # Display as tags
+            topic_html = " ".join([f"<span style='background-color:#f0f2f6;padding:4px 10px;margin:0 6px;border-radius:10px'>{topic}</span>" for topic in common_topics])
+            st.markdown(topic_html, unsafe_allow_html=True)
+
+@st.fragment
+def render_hindi_summary(company_name: str, results: Dict[str, Any]) -> None:
+    """Render the Hindi summary and audio tab"""
+    st.subheader("Hindi Summary and Audio")
+
+    # Display Hindi summary
+    if "Hindi Summary" in results:
+        st.markdown("### Hindi Text Summary")
+        st.text(results["Hindi Summary"])
+
+    # Display audio player
+    if "Audio" in results and results["Audio"]:
+        st.markdown("### Hindi Audio Summary")
+        audio_url = get_audio_url(company_name)
+        st.markdown(autoplay_audio(audio_url), unsafe_allow_html=True)
+        st.markdown(f"[Download Audio]({audio_url})")
 
 if __name__ == "__main__":
     main()
@@ -2,6 +2,17 @@ import os
 import subprocess
 import json
 import argparse
+import shutil
+import sys
+
+# File extensions tracked with git-lfs on Hugging Face Spaces
+LFS_EXTENSIONS = (
+    "*.7z", "*.arrow", "*.bin", "*.bz2", "*.ckpt", "*.ftz", "*.gz", "*.h5",
+    "*.joblib", "*.lfs.*", "*.model", "*.msgpack", "*.npy", "*.npz",
+    "*.onnx", "*.ot", "*.parquet", "*.pb", "*.pt", "*.pth", "*.rar",
+    "*.safetensors", "*.tar.*", "*.tflite", "*.tgz", "*.wasm", "*.xz",
+    "*.zip", "*.zst", "*tfevents*"
+)
 
 def deploy_to_huggingface(hf_token, space_name):
     """
@@ -80,43 +91,14 @@ The application provides a REST API for programmatic access. API documentation i
     
     for file in files_to_copy:
         if os.path.exists(file):
-            subprocess.check_call(["cp", file, "hf_space/"])
+            shutil.copy(file, "hf_space/")
     
     # Write space configuration
     with open("hf_space/README.md", "w") as f:
         f.write(hf_readme)
     
     with open("hf_space/.gitattributes", "w") as f:
-        f.write("*.7z filter=lfs diff=lfs merge=lfs -text\n")
-        f.write("*.arrow filter=lfs diff=lfs merge=lfs -text\n")
-        f.write("*.bin filter=lfs diff=lfs merge=lfs -text\n")
-        f.write("*.bz2 filter=lfs diff=lfs merge=lfs -text\n")
-        f.write("*.ckpt filter=lfs diff=lfs merge=lfs -text\n")
-        f.write("*.ftz filter=lfs diff=lfs merge=lfs -text\n")
-        f.write("*.gz filter=lfs diff=lfs merge=lfs -text\n")
-        f.write("*.h5 filter=lfs diff=lfs merge=lfs -text\n")
-        f.write("*.joblib filter=lfs diff=lfs merge=lfs -text\n")
-        f.write("*.lfs.* filter=lfs diff=lfs merge=lfs -text\n")
-        f.write("*.model filter=lfs diff=lfs merge=lfs -text\n")
-        f.write("*.msgpack filter=lfs diff=lfs merge=lfs -text\n")
-        f.write("*.npy filter=lfs diff=lfs merge=lfs -text\n")
-        f.write("*.npz filter=lfs diff=lfs merge=lfs -text\n")
-        f.write("*.onnx filter=lfs diff=lfs merge=lfs -text\n")
-        f.write("*.ot filter=lfs diff=lfs merge=lfs -text\n")
-        f.write("*.parquet filter=lfs diff=lfs merge=lfs -text\n")
-        f.write("*.pb filter=lfs diff=lfs merge=lfs -text\n")
-        f.write("*.pt filter=lfs diff=lfs merge=lfs -text\n")
-        f.write("*.pth filter=lfs diff=lfs merge=lfs -text\n")
-        f.write("*.rar filter=lfs diff=lfs merge=lfs -text\n")
-        f.write("*.safetensors filter=lfs diff=lfs merge=lfs -text\n")
-        f.write("*.tar.* filter=lfs diff=lfs merge=lfs -text\n")
-        f.write("*.tflite filter=lfs diff=lfs merge=lfs -text\n")
-        f.write("*.tgz filter=lfs diff=lfs merge=lfs -text\n")
-        f.write("*.wasm filter=lfs diff=lfs merge=lfs -text\n")
-        f.write("*.xz filter=lfs diff=lfs merge=lfs -text\n")
-        f.write("*.zip filter=lfs diff=lfs merge=lfs -text\n")
-        f.write("*.zst filter=lfs diff=lfs merge=lfs -text\n")
-        f.write("*tfevents* filter=lfs diff=lfs merge=lfs -text\n")
+        f.write("\n".join(f"{ext} filter=lfs diff=lfs merge=lfs -text" for ext in LFS_EXTENSIONS) + "\n")
     
     # Write space configuration
     with open("hf_space/space.json", "w") as f:
@@ -0,0 +1,28 @@
+"""
+Gunicorn configuration for production serving.
+
+Run with: gunicorn api:app -c gunicorn.conf.py
+
+A single uvicorn process serves requests on one event loop; a few
+UvicornWorker processes add request concurrency. The heavy analysis work
+runs in each worker's small process pool (ANALYSIS_POOL_WORKERS, default
+2), and every pool process holds a full copy of the sentiment model -
+so total memory scales with workers * pool size. Half the core count of
+web workers plus the default pool keeps that product at roughly one
+model-loaded process per core.
+
+Note: the in-process results cache is per-worker. Set REDIS_URL so
+workers share results through the Redis tier; without it, run with
+workers=1 or accept cache fragmentation.
+"""
+import multiprocessing
+
+bind = "0.0.0.0:8000"
+workers = max(2, multiprocessing.cpu_count() // 2)
+worker_class = "uvicorn.workers.UvicornWorker"
+timeout = 120
+
+# Import the app once in the master and fork workers copy-on-write. The
+# sentiment model is not loaded here - it loads lazily inside the pool
+# processes - so this only saves the import-time work
+preload_app = True
@@ -1,16 +1,93 @@
 import subprocess
+import threading
 import time
+import random
 import webbrowser
 import os
 import sys
 import requests
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from urllib.parse import urlparse
 
+def _drain(stream, buffer):
+    """Continuously read a child's stderr so the pipe never fills and blocks it."""
+    for line in stream:
+        buffer.append(line)
+
+def start_process(cmd):
+    """
+    Launch a child process with stdout discarded and stderr drained into a
+    bounded buffer. Leaving both on PIPE unread lets the ~64KB OS pipe
+    buffer fill up, at which point the child blocks on writes and the
+    service stalls.
+
+    Returns:
+        (process, buffer) where buffer holds the last 200 stderr lines
+    """
+    process = subprocess.Popen(
+        cmd,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+        text=True,
+        bufsize=1
+    )
+    buffer = deque(maxlen=200)
+    threading.Thread(target=_drain, args=(process.stderr, buffer), daemon=True).start()
+    return process, buffer
+
+def wait_for_http(url, process, name, max_retries=12, base=0.25, cap=4.0):
+    """
+    Poll a URL until it returns 200, backing off exponentially with jitter.
+    Polls aggressively at first (0.25s) and caps the delay at a few
+    seconds, so fast startups are detected in well under a second while
+    the worst-case budget (~30s) still covers a cold start that has to
+    import torch and transformers before binding.
+
+    Args:
+        url: URL to probe
+        process: Subprocess backing the service (gives up early if it exits)
+        name: Service name used in log messages
+        max_retries: Maximum number of probe attempts
+        base: Initial delay in seconds
+        cap: Maximum delay in seconds
+
+    Returns:
+        True once the service responds with 200, False otherwise
+    """
+    for attempt in range(max_retries):
+        # Bail immediately if the process already died - no point in
+        # sleeping through the remaining attempts
+        if process.poll() is not None:
+            return False
+
+        try:
+            response = requests.get(url, timeout=2)
+            if response.status_code == 200:
+                return True
+        except requests.exceptions.RequestException:
+            pass
+
+        if attempt < max_retries - 1:
+            # Full jitter keeps repeated probes from landing in lockstep
+            delay = min(cap, base * 2 ** attempt) * (0.5 + random.random() * 0.5)
+            print(f"Attempt {attempt+1}/{max_retries}: {name} not ready yet, waiting...")
+            time.sleep(delay)
+
+    return False
+
 def is_port_in_use(port):
     """Check if a port is already in use"""
     import socket
+    # A bind attempt answers immediately; connect_ex pays a handshake
+    # round-trip and can hang up to the OS TCP timeout on firewalled hosts
     with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
-        return s.connect_ex(('localhost', port)) == 0
+        s.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        try:
+            s.bind(('127.0.0.1', port))
+            return False
+        except OSError:
+            return True
 
 def main():
     print("Starting Company News Analyzer...")
@@ -22,14 +99,14 @@ def main():
             print(f"Error: {file} not found. Please make sure all required files are present.")
             sys.exit(1)
     
-    # Check if the ports are already in use
-    if is_port_in_use(8000):
-        print("Error: Port 8000 is already in use. Make sure no other application is using it.")
-        sys.exit(1)
-    
-    if is_port_in_use(8501):
-        print("Error: Port 8501 is already in use. Make sure no other application is using it.")
-        sys.exit(1)
+    # Check both ports in parallel
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        ports_busy = dict(zip((8000, 8501), pool.map(is_port_in_use, (8000, 8501))))
+
+    for port, busy in ports_busy.items():
+        if busy:
+            print(f"Error: Port {port} is already in use. Make sure no other application is using it.")
+            sys.exit(1)
     
     # Check if Python dependencies are installed
     try:
@@ -37,7 +114,7 @@ def main():
         import streamlit
         import pandas
         import requests
-        import bs4
+        import selectolax
         import uvicorn
         from gtts import gTTS
     except ImportError as e:
@@ -47,71 +124,43 @@ def main():
     
     # Start FastAPI server in a separate process
     print("Starting FastAPI server...")
-    api_process = subprocess.Popen(
-        ["uvicorn", "api:app", "--host", "0.0.0.0", "--port", "8000"],
-        stdout=subprocess.PIPE,
-        stderr=subprocess.PIPE,
-        text=True
+    api_process, api_errors = start_process(
+        ["uvicorn", "api:app", "--host", "0.0.0.0", "--port", "8000"]
     )
     
-    # Wait for the API server to start with timeout and retries
+    # Wait for the API server to start with backoff and retries
     print("Waiting for API server to start...")
-    max_retries = 15
-    for i in range(max_retries):
-        try:
-            response = requests.get("http://localhost:8000/", timeout=2)
-            if response.status_code == 200:
-                print("API server started successfully!")
-                break
-        except requests.exceptions.RequestException:
-            if i < max_retries - 1:
-                print(f"Attempt {i+1}/{max_retries}: API server not ready yet, waiting...")
-                time.sleep(2)
-            else:
-                print("Error: Could not connect to API server after multiple attempts.")
-                # Check if process is still running
-                if api_process.poll() is None:
-                    stderr_output = api_process.stderr.read()
-                    api_process.terminate()
-                    print(f"API process error: {stderr_output}")
-                else:
-                    print("API process terminated unexpectedly.")
-                sys.exit(1)
+    if wait_for_http("http://localhost:8000/", api_process, "API server"):
+        print("API server started successfully!")
+    else:
+        print("Error: Could not connect to API server after multiple attempts.")
+        # Check if process is still running
+        if api_process.poll() is None:
+            api_process.terminate()
+            print(f"API process error: {''.join(api_errors)}")
+        else:
+            print("API process terminated unexpectedly.")
+        sys.exit(1)
     
     # Start Streamlit app in a separate process
     print("Starting Streamlit app...")
-    streamlit_process = subprocess.Popen(
-        ["streamlit", "run", "app.py"],
-        stdout=subprocess.PIPE,
-        stderr=subprocess.PIPE,
-        text=True
-    )
+    streamlit_process, streamlit_errors = start_process(["streamlit", "run", "app.py"])
     
     # Wait for Streamlit to start
     print("Waiting for Streamlit to start...")
-    max_retries = 15
     streamlit_url = "http://localhost:8501"
-    for i in range(max_retries):
-        try:
-            response = requests.get(streamlit_url, timeout=2)
-            if response.status_code == 200:
-                print("Streamlit server started successfully!")
-                break
-        except requests.exceptions.RequestException:
-            if i < max_retries - 1:
-                print(f"Attempt {i+1}/{max_retries}: Streamlit not ready yet, waiting...")
-                time.sleep(2)
-            else:
-                print("Error: Could not connect to Streamlit after multiple attempts.")
-                # Check if process is still running
-                if streamlit_process.poll() is None:
-                    stderr_output = streamlit_process.stderr.read()
-                    streamlit_process.terminate()
-                    print(f"Streamlit process error: {stderr_output}")
-                else:
-                    print("Streamlit process terminated unexpectedly.")
-                api_process.terminate()
-                sys.exit(1)
+    if wait_for_http(streamlit_url, streamlit_process, "Streamlit"):
+        print("Streamlit server started successfully!")
+    else:
+        print("Error: Could not connect to Streamlit after multiple attempts.")
+        # Check if process is still running
+        if streamlit_process.poll() is None:
+            streamlit_process.terminate()
+            print(f"Streamlit process error: {''.join(streamlit_errors)}")
+        else:
+            print("Streamlit process terminated unexpectedly.")
+        api_process.terminate()
+        sys.exit(1)
     
     # Open web browser
     print("Opening web browser...")
@@ -127,15 +176,13 @@ def main():
             
             if api_status is not None:
                 print(f"API server stopped unexpectedly with exit code {api_status}")
-                stderr_output = api_process.stderr.read()
-                print(f"API process error: {stderr_output}")
+                print(f"API process error: {''.join(api_errors)}")
                 streamlit_process.terminate()
                 break
-                
+
             if streamlit_status is not None:
                 print(f"Streamlit stopped unexpectedly with exit code {streamlit_status}")
-                stderr_output = streamlit_process.stderr.read()
-                print(f"Streamlit process error: {stderr_output}")
+                print(f"Streamlit process error: {''.join(streamlit_errors)}")
                 api_process.terminate()
                 break
                 
@@ -1,21 +1,118 @@
 import requests
-from bs4 import BeautifulSoup
-import pandas as pd
+import httpx
+import feedparser
+from selectolax.parser import HTMLParser
+import torch
 from transformers import pipeline
-from sklearn.feature_extraction.text import CountVectorizer
 from gtts import gTTS
+import asyncio
+import hashlib
+import json
+import os
+from collections import Counter
+from functools import lru_cache
+from itertools import islice, takewhile
 import re
 import time
 import random
 from typing import List, Dict, Any
+from urllib.parse import urlparse
 import logging
 
+try:
+    # 2-4x faster event loop for the scraping coroutines; unix-only, the
+    # stock loop is used elsewhere
+    import uvloop
+    uvloop.install()
+except ImportError:
+    pass
+
 # Set up logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
-# Initialize sentiment analysis pipeline
-sentiment_analyzer = pipeline("sentiment-analysis", model="distilbert-base-uncased-finetuned-sst-2-english")
+SENTIMENT_MODEL = "distilbert-base-uncased-finetuned-sst-2-english"
+ONNX_MODEL_DIR = "onnx_sentiment"
+
+def _build_sentiment_pipeline():
+    """
+    Build the sentiment pipeline, quantized for throughput.
+
+    On CPU, prefers an int8 ONNX Runtime model (roughly 2-4x faster dense
+    matmuls via VNNI, half the weight bytes, <1% accuracy loss on SST-2);
+    the export and quantization run once and are cached on disk. Falls
+    back to the torch pipeline - FP16 on GPU, dynamic int8 on CPU - when
+    optimum/onnxruntime aren't installed.
+    """
+    if not torch.cuda.is_available():
+        try:
+            import onnxruntime
+            from onnxruntime.quantization import quantize_dynamic, QuantType
+            from optimum.onnxruntime import ORTModelForSequenceClassification
+            from transformers import AutoTokenizer
+
+            int8_path = os.path.join(ONNX_MODEL_DIR, "model-int8.onnx")
+            if not os.path.isfile(int8_path):
+                # One-time export + dynamic int8 quantization. Several pool
+                # processes warm up concurrently and race this check, so
+                # everything is written into a process-private dir and
+                # published into place with atomic renames (the pattern
+                # store_cached_article uses) - the int8 file goes last,
+                # since its existence is what gates this branch
+                tmp_dir = f"{ONNX_MODEL_DIR}.tmp.{os.getpid()}"
+                exported = ORTModelForSequenceClassification.from_pretrained(SENTIMENT_MODEL, export=True)
+                exported.save_pretrained(tmp_dir)
+                quantize_dynamic(
+                    os.path.join(tmp_dir, "model.onnx"),
+                    os.path.join(tmp_dir, "model-int8.onnx"),
+                    weight_type=QuantType.QInt8
+                )
+                os.makedirs(ONNX_MODEL_DIR, exist_ok=True)
+                for fname in os.listdir(tmp_dir):
+                    if fname != "model-int8.onnx":
+                        os.replace(os.path.join(tmp_dir, fname), os.path.join(ONNX_MODEL_DIR, fname))
+                os.replace(os.path.join(tmp_dir, "model-int8.onnx"), int8_path)
+                os.rmdir(tmp_dir)
+
+            sess_options = onnxruntime.SessionOptions()
+            sess_options.intra_op_num_threads = max(1, (os.cpu_count() or 2) // 2)
+            model = ORTModelForSequenceClassification.from_pretrained(
+                ONNX_MODEL_DIR,
+                file_name="model-int8.onnx",
+                provider="CPUExecutionProvider",
+                session_options=sess_options
+            )
+            tokenizer = AutoTokenizer.from_pretrained(SENTIMENT_MODEL)
+            logger.info("Loaded int8 ONNX sentiment model")
+            return pipeline("sentiment-analysis", model=model, tokenizer=tokenizer)
+
+        except ImportError:
+            logger.info("optimum/onnxruntime not installed; using dynamic int8 torch model")
+        except Exception as e:
+            logger.error(f"Error building ONNX sentiment model, falling back to torch: {str(e)}")
+
+    analyzer = pipeline(
+        "sentiment-analysis",
+        model=SENTIMENT_MODEL,
+        device=0 if torch.cuda.is_available() else -1
+    )
+    if torch.cuda.is_available():
+        analyzer.model.half()
+    else:
+        analyzer.model = torch.quantization.quantize_dynamic(
+            analyzer.model, {torch.nn.Linear}, dtype=torch.qint8
+        )
+    return analyzer
+
+@lru_cache(maxsize=1)
+def get_sentiment_analyzer():
+    """
+    Lazily build and cache the sentiment pipeline.
+    Importing utils no longer pays the multi-second model load - cold
+    paths like dependency checks and CLI help stay fast, and the model
+    is constructed exactly once per process on first use.
+    """
+    return _build_sentiment_pipeline()
 
 # Headers to mimic browser requests
 HEADERS = {
@@ -27,216 +124,393 @@ HEADERS = {
     'Cache-Control': 'max-age=0',
 }
 
+# Shared session for the synchronous requests path. Reusing one session
+# keeps TCP/TLS connections alive between calls and centralises retries;
+# article scraping already pools connections through the httpx client.
+_SESSION = requests.Session()
+_SESSION.headers.update(HEADERS)
+_retry = requests.adapters.Retry(
+    total=2,
+    backoff_factor=0.3,
+    status_forcelist=[429, 500, 502, 503, 504],
+)
+_adapter = requests.adapters.HTTPAdapter(pool_connections=20, pool_maxsize=20, max_retries=_retry)
+_SESSION.mount('http://', _adapter)
+_SESSION.mount('https://', _adapter)
+
 def search_news(company_name: str, num_articles: int = 15) -> List[str]:
     """
-    Search for news articles about a company using Google News.
+    Search for news articles about a company using the Google News RSS feed.
     Returns a list of URLs to scrape.
-    
+
     Args:
         company_name: Name of the company to search for
         num_articles: Number of articles to try to find (will try to get more since some might fail)
-    
+
     Returns:
         List of URLs to news articles
     """
     try:
         # Format company name for URL
         query = company_name.replace(' ', '+')
-        # Google News search URL
-        search_url = f"https://www.google.com/search?q={query}+news&tbm=nws"
-        
-        response = requests.get(search_url, headers=HEADERS)
+        # The RSS feed is an order of magnitude smaller than the search
+        # results HTML, is a stable contract rather than scraped CSS
+        # classes, and its links are already canonical
+        feed_url = f"https://news.google.com/rss/search?q={query}&hl=en-US"
+
+        response = _SESSION.get(feed_url, timeout=10)
         response.raise_for_status()
-        
-        soup = BeautifulSoup(response.text, 'html.parser')
-        
-        # Find all news article links
-        article_links = []
-        for g in soup.find_all('div', class_='SoaBEf'):
-            links = g.find_all('a')
-            if links:
-                href = links[0].get('href')
-                if href.startswith('/url?q='):
-                    # Extract actual URL from Google's redirect URL
-                    actual_url = href.replace('/url?q=', '').split('&sa=')[0]
-                    article_links.append(actual_url)
-                elif href.startswith('http'):
-                    article_links.append(href)
-        
+
+        feed = feedparser.parse(response.content)
+        article_links = [entry.link for entry in feed.entries[:num_articles]]
+
         logger.info(f"Found {len(article_links)} potential news articles about {company_name}")
-        return article_links[:num_articles]
-    
+        return article_links
+
     except Exception as e:
         logger.error(f"Error searching for news: {str(e)}")
         return []
 
-def scrape_article(url: str) -> Dict[str, Any]:
+# Cap on simultaneous article fetches; replaces the old per-URL sleep as
+# the rate-limiting mechanism
+SCRAPE_CONCURRENCY = 10
+
+# Composite CSS selectors matching the common class names, built once.
+# Attribute substring selectors ([class*=...]) replace the old
+# class-regex scans over the whole soup
+_ARTICLE_P_SELECTOR = ', '.join(
+    f'{tag}[class*="{cls}"] p'
+    for tag in ('article', 'div')
+    for cls in ('article', 'content', 'story', 'body')
+)
+_DATE_SELECTOR = ', '.join(
+    f'{tag}[class*="{cls}"]'
+    for tag in ('time', 'span', 'p', 'div')
+    for cls in ('date', 'time', 'published')
+)
+
+# Text-processing patterns, compiled once instead of per article
+_PUNCT_RE = re.compile(r'[^\w\s]')
+_WS_RE = re.compile(r'\s+')
+_SENT_SPLIT_RE = re.compile(r'[.!?]+')  # + collapses runs of punctuation
+
+# On-disk article cache keyed by URL hash, so re-running an analysis
+# within the TTL skips the fetch and parse entirely
+ARTICLE_CACHE_DIR = "cache"
+ARTICLE_CACHE_TTL = 3600
+
+def _article_cache_path(url: str) -> str:
+    key = hashlib.blake2b(url.encode(), digest_size=16).hexdigest()
+    return os.path.join(ARTICLE_CACHE_DIR, f"{key}.json")
+
+def load_cached_article(url: str) -> Dict[str, Any]:
+    """Return the cached article data for a URL if present and fresh."""
+    path = _article_cache_path(url)
+    try:
+        if os.path.isfile(path) and time.time() - os.path.getmtime(path) < ARTICLE_CACHE_TTL:
+            with open(path) as f:
+                return json.load(f)
+    except (OSError, ValueError) as e:
+        logger.error(f"Error reading article cache for {url}: {str(e)}")
+    return None
+
+def store_cached_article(url: str, article: Dict[str, Any]):
+    """Write article data to the cache atomically (tmp file + rename)."""
+    path = _article_cache_path(url)
+    try:
+        os.makedirs(ARTICLE_CACHE_DIR, exist_ok=True)
+        tmp_path = path + ".tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(article, f)
+        os.replace(tmp_path, path)
+    except OSError as e:
+        logger.error(f"Error writing article cache for {url}: {str(e)}")
+
+# Stop collecting paragraph text past this point; downstream steps only
+# look at the head of the content anyway
+_MAX_CONTENT_CHARS = 5000
+
+def _collect_paragraphs(nodes) -> List[str]:
+    """
+    Gather paragraph text from matched nodes in one pass.
+
+    Deduplicates by node identity (a paragraph nested under several
+    matching containers is matched once per selector branch) and stops
+    extracting once enough content has accumulated. Accumulating in a
+    list and joining once keeps the concatenation linear.
+    """
+    parts = []
+    seen = set()
+    total = 0
+    for node in nodes:
+        if node.mem_id in seen:
+            continue
+        seen.add(node.mem_id)
+        text = node.text()
+        parts.append(text)
+        total += len(text)
+        if total >= _MAX_CONTENT_CHARS:
+            break
+    return parts
+
+async def scrape_article(client: httpx.AsyncClient, url: str, semaphore: asyncio.Semaphore) -> Dict[str, Any]:
     """
     Scrape a news article and extract relevant information.
-    
+
     Args:
+        client: Shared HTTP client used for the fetch
         url: URL of the article to scrape
-        
+        semaphore: Concurrency gate shared across the batch
+
     Returns:
         Dictionary containing article data or None if scraping failed
     """
     try:
-        # Add random delay to avoid rate limiting
-        time.sleep(random.uniform(1, 3))
-        
-        response = requests.get(url, headers=HEADERS, timeout=10)
-        response.raise_for_status()
-        
-        soup = BeautifulSoup(response.text, 'html.parser')
-        
+        # Serve recent scrapes from the disk cache
+        cached = load_cached_article(url)
+        if cached is not None:
+            return cached
+
+        async with semaphore:
+            for attempt in range(2):
+                try:
+                    response = await client.get(url)
+                    response.raise_for_status()
+                    break
+                except httpx.HTTPError:
+                    if attempt == 1:
+                        raise
+                    # Jittered pause before the single retry
+                    await asyncio.sleep(random.uniform(0.5, 1.5))
+
+        # selectolax wraps lexbor, which parses and runs CSS selectors
+        # several times faster than BeautifulSoup over lxml
+        tree = HTMLParser(response.content)
+
         # Extract title
-        title = soup.find('title')
-        title_text = title.text if title else "No title found"
-        
+        title = tree.css_first('title')
+        title_text = title.text() if title else "No title found"
+
         # Extract main content - this is a simplified approach and may need to be customized
-        # based on the specific news sites you're targeting
-        article_text = ""
-        
-        # Try to find article content with common class names
-        article_tags = soup.find_all(['article', 'div'], class_=re.compile('(article|content|story|body)', re.I))
-        if article_tags:
-            for tag in article_tags:
-                paragraphs = tag.find_all('p')
-                if paragraphs:
-                    for p in paragraphs:
-                        article_text += p.text + " "
-        
-        # If no article content found, try to get all paragraphs
-        if not article_text:
-            paragraphs = soup.find_all('p')
-            for p in paragraphs:
-                article_text += p.text + " "
-        
+        # based on the specific news sites you're targeting.
+        parts = _collect_paragraphs(tree.css(_ARTICLE_P_SELECTOR))
+
+        # If no article content found, fall back to all paragraphs
+        if not parts:
+            parts = _collect_paragraphs(tree.css('p'))
+
         # Clean up the text
-        article_text = re.sub(r'\s+', ' ', article_text).strip()
-        
+        article_text = _WS_RE.sub(' ', ' '.join(parts)).strip()
+
         # Create summary (first 300 characters or first 3 sentences)
-        sentences = re.split(r'[.!?]', article_text)
+        sentences = _SENT_SPLIT_RE.split(article_text)
         summary = ' '.join(sentences[:3]).strip()
         if len(summary) > 300:
             summary = summary[:297] + '...'
         
         # Extract publication date (simplified)
         date = None
-        date_tags = soup.find_all(['time', 'span', 'p', 'div'], class_=re.compile('(date|time|published)', re.I))
-        if date_tags:
-            date = date_tags[0].text.strip()
+        date_tag = tree.css_first(_DATE_SELECTOR)
+        if date_tag is not None:
+            date = date_tag.text().strip()
         
-        # Return article data
-        return {
+        # Cache and return article data
+        article_data = {
             "url": url,
             "title": title_text,
             "content": article_text,
             "summary": summary,
             "date": date
         }
-    
+        store_cached_article(url, article_data)
+        return article_data
+
     except Exception as e:
         logger.error(f"Error scraping article {url}: {str(e)}")
         return None
 
+# Pre-filter bounds: HEAD responses outside these are very unlikely to
+# be scrapable article pages
+_HEAD_TIMEOUT = 3
+_MIN_ARTICLE_BYTES = 5 * 1024
+_MAX_ARTICLE_BYTES = 5 * 1024 * 1024
+_MAX_PER_DOMAIN = 2
+
+# Hosts that only redirect to the real publisher. Google News RSS links
+# all live on news.google.com, so capping that host would throw away the
+# whole batch; the cap only makes sense on publisher domains.
+_AGGREGATOR_HOSTS = frozenset({'news.google.com'})
+
+def dedupe_by_domain(urls: List[str]) -> List[str]:
+    """Keep at most a couple of URLs per publisher domain, preserving order."""
+    per_domain = Counter()
+    kept = []
+    for url in urls:
+        domain = urlparse(url).netloc
+        if domain in _AGGREGATOR_HOSTS:
+            kept.append(url)
+        elif per_domain[domain] < _MAX_PER_DOMAIN:
+            per_domain[domain] += 1
+            kept.append(url)
+    return kept
+
+async def head_check(client: httpx.AsyncClient, url: str, semaphore: asyncio.Semaphore) -> bool:
+    """
+    Cheaply reject URLs that won't yield an article: non-HTML content
+    types and bodies outside a sane size range. A HEAD response is a few
+    hundred bytes versus a full page download for the doomed GET.
+    """
+    # Cached articles already proved scrapable - skip the round-trip
+    if load_cached_article(url) is not None:
+        return True
+    try:
+        async with semaphore:
+            response = await client.head(url, timeout=_HEAD_TIMEOUT)
+        content_type = response.headers.get('content-type', '')
+        if content_type and 'text/html' not in content_type:
+            return False
+        length = response.headers.get('content-length')
+        if length is not None and not (_MIN_ARTICLE_BYTES <= int(length) <= _MAX_ARTICLE_BYTES):
+            return False
+        return True
+    except (httpx.HTTPError, ValueError):
+        return False
+
+async def fetch_articles(urls: List[str]) -> List[Dict[str, Any]]:
+    """
+    Scrape a batch of article URLs concurrently over one pooled client,
+    after deduping by domain and HEAD-checking each candidate.
+
+    Args:
+        urls: URLs to fetch
+
+    Returns:
+        List of article dictionaries (None entries for failed scrapes)
+    """
+    urls = dedupe_by_domain(urls)
+    limits = httpx.Limits(max_connections=20)
+    semaphore = asyncio.Semaphore(SCRAPE_CONCURRENCY)
+    async with httpx.AsyncClient(
+        headers=HEADERS, timeout=10, follow_redirects=True, limits=limits
+    ) as client:
+        verdicts = await asyncio.gather(*(head_check(client, url, semaphore) for url in urls))
+        candidates = [url for url, keep in zip(urls, verdicts) if keep]
+        return await asyncio.gather(*(scrape_article(client, url, semaphore) for url in candidates))
+
 def extract_news_articles(company_name: str, num_articles: int = 10) -> List[Dict[str, Any]]:
     """
     Extract news articles about a company.
-    
+
     Args:
         company_name: Name of the company
         num_articles: Target number of articles to extract
-        
+
     Returns:
         List of dictionaries containing article data
     """
     # Get more URLs than needed since some might fail to scrape
     article_urls = search_news(company_name, num_articles * 2)
-    
+
+    # Fetch everything in parallel - wall time is roughly the slowest
+    # article instead of the sum of all of them
+    scraped = asyncio.run(fetch_articles(article_urls))
+
     articles = []
-    for url in article_urls:
-        article_data = scrape_article(url)
+    for article_data in scraped:
         if article_data and len(article_data["content"]) > 100:  # Ensure meaningful content
             articles.append(article_data)
             logger.info(f"Successfully scraped article: {article_data['title']}")
-        
+
         # Stop once we have enough articles
         if len(articles) >= num_articles:
             break
-    
+
     logger.info(f"Successfully extracted {len(articles)} articles about {company_name}")
     return articles[:num_articles]  # Ensure we return at most num_articles
 
-def analyze_sentiment(text: str) -> Dict[str, Any]:
+# Model label -> display category; anything unknown falls back to Neutral
+LABEL_MAP = {"POSITIVE": "Positive", "NEGATIVE": "Negative"}
+
+def analyze_sentiments(texts: List[str]) -> List[Dict[str, Any]]:
     """
-    Analyze the sentiment of a text.
-    
+    Analyze the sentiment of a batch of texts in one pipeline call.
+
     Args:
-        text: Text to analyze
-        
+        texts: Texts to analyze
+
     Returns:
-        Dictionary with sentiment data
+        List of dictionaries with sentiment data, one per input text
     """
     try:
-        # Truncate text to 512 tokens (model limit)
-        truncated_text = text[:512]
-        
-        # Get sentiment from model
-        result = sentiment_analyzer(truncated_text)[0]
-        label = result['label']
-        score = result['score']
-        
-        # Map to simple categories
-        if label == "POSITIVE":
-            sentiment = "Positive"
-        elif label == "NEGATIVE":
-            sentiment = "Negative"
-        else:
-            sentiment = "Neutral"
-        
-        return {
-            "sentiment": sentiment,
-            "confidence": score
-        }
-    
+        # One batched call fuses the per-text forward passes into larger
+        # matmuls instead of N single-string pipeline invocations.
+        # Truncating at the tokenizer (256 tokens, padded to the longest
+        # text in the batch) caps sequence length properly - character
+        # slicing under-fills some texts and can split multi-byte chars
+        results = get_sentiment_analyzer()(
+            texts, batch_size=16, truncation=True, max_length=256, padding="longest"
+        )
+
+        return [
+            {
+                "sentiment": LABEL_MAP.get(result['label'], "Neutral"),
+                # Plain float: the ONNX path can hand back numpy scalars,
+                # which orjson refuses to serialize
+                "confidence": float(result['score'])
+            }
+            for result in results
+        ]
+
     except Exception as e:
         logger.error(f"Error analyzing sentiment: {str(e)}")
-        return {"sentiment": "Neutral", "confidence": 0.5}  # Default fallback
+        return [{"sentiment": "Neutral", "confidence": 0.5} for _ in texts]  # Default fallback
+
+def analyze_sentiment(text: str) -> Dict[str, Any]:
+    """
+    Analyze the sentiment of a single text.
+
+    Args:
+        text: Text to analyze
+
+    Returns:
+        Dictionary with sentiment data
+    """
+    return analyze_sentiments([text])[0]
+
+# Common stopwords (simplified); frozenset makes the membership test a
+# hash lookup instead of a list scan per token
+STOPWORDS = frozenset([
+    'the', 'and', 'a', 'to', 'in', 'of', 'is', 'it', 'that', 'for',
+    'on', 'with', 'as', 'was', 'by', 'at'
+])
 
 def extract_topics(text: str, top_n: int = 3) -> List[str]:
     """
     Extract main topics from text using simple keyword extraction.
-    
+
     Args:
         text: Text to analyze
         top_n: Number of topics to extract
-        
+
     Returns:
         List of topic keywords
     """
     try:
         # Clean text
-        clean_text = re.sub(r'[^\w\s]', '', text.lower())
-        
-        # Remove common stopwords (simplified)
-        stopwords = ['the', 'and', 'a', 'to', 'in', 'of', 'is', 'it', 'that', 'for', 'on', 'with', 'as', 'was', 'by', 'at']
-        word_tokens = clean_text.split()
-        clean_tokens = [w for w in word_tokens if w not in stopwords and len(w) > 2]
-        
-        # Count word frequency
-        vectorizer = CountVectorizer(max_features=top_n*2, ngram_range=(1, 2))
-        X = vectorizer.fit_transform([' '.join(clean_tokens)])
-        
-        # Get top words/phrases
-        top_words = vectorizer.get_feature_names_out()
-        
+        clean_text = _PUNCT_RE.sub('', text.lower())
+        clean_tokens = [w for w in clean_text.split() if w not in STOPWORDS and len(w) > 2]
+
+        # Count unigrams and bigrams directly - for a single document a
+        # Counter does what the CountVectorizer fit did without building
+        # a vocabulary dict and sparse matrix
+        counts = Counter(clean_tokens)
+        counts.update(' '.join(pair) for pair in zip(clean_tokens, clean_tokens[1:]))
+
         # Format for readability (capitalize first letter)
-        topics = [' '.join(word.split('_')) for word in top_words[:top_n]]
-        topics = [t.title() for t in topics]
-        
-        return topics
-    
+        topics = [term.title() for term, _ in counts.most_common(top_n)]
+
+        return topics if topics else ["General News"]
+
     except Exception as e:
         logger.error(f"Error extracting topics: {str(e)}")
         return ["General News"]  # Default fallback
@@ -264,9 +538,15 @@ def perform_comparative_analysis(articles: List[Dict[str, Any]]) -> Dict[str, An
             # Use the Topics key instead of topics (case matters)
             all_topics.extend(article["Topics"])
         
-        # Count topic frequency
-        topic_freq = pd.Series(all_topics).value_counts().to_dict()
-        common_topics = [topic for topic, count in topic_freq.items() if count > 1]
+        # Count topic frequency. most_common() is sorted, so takewhile
+        # stops at the first singleton instead of testing every topic,
+        # and only the 5 reported topics are ever materialized
+        topic_counts = Counter(all_topics)
+        common_topics = [
+            topic for topic, _ in islice(
+                takewhile(lambda tc: tc[1] > 1, topic_counts.most_common()), 5
+            )
+        ]
         
         # Generate coverage differences
         coverage_differences = []
@@ -307,7 +587,7 @@ def perform_comparative_analysis(articles: List[Dict[str, Any]]) -> Dict[str, An
         return {
             "Sentiment Distribution": sentiment_counts,
             "Coverage Differences": coverage_differences,
-            "Common Topics": common_topics[:5] if common_topics else ["No common topics"],
+            "Common Topics": common_topics if common_topics else ["No common topics"],
             "Final Sentiment Analysis": final_sentiment
         }
     
@@ -345,27 +625,59 @@ def create_hindi_summary(company_name: str, analysis_results: Dict[str, Any]) ->
 
     return hindi_summary
 
+# On-disk TTS cache, keyed by the hash of the spoken text, with a total
+# byte budget so old audio doesn't accumulate forever
+AUDIO_CACHE_DIR = "audio_cache"
+AUDIO_CACHE_MAX_BYTES = 50 * 1024 * 1024
+
+def prune_audio_cache():
+    """Evict least recently used cached MP3s once the byte budget is exceeded."""
+    try:
+        entries = []
+        for entry in os.scandir(AUDIO_CACHE_DIR):
+            if entry.is_file():
+                stat = entry.stat()
+                entries.append((stat.st_atime, stat.st_size, entry.path))
+
+        total_bytes = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total_bytes <= AUDIO_CACHE_MAX_BYTES:
+                break
+            os.remove(path)
+            total_bytes -= size
+
+    except OSError as e:
+        logger.error(f"Error pruning audio cache: {str(e)}")
+
 def text_to_hindi_speech(text: str) -> str:
     """
     Convert text to Hindi speech.
-    
+
     Args:
         text: Text to convert to speech (in Hindi)
-        
+
     Returns:
         Filename of the generated audio
     """
     try:
-        # Generate a unique filename
-        filename = f"hindi_speech_{int(time.time())}.mp3"
-        
+        # Name the file by content hash so identical summaries reuse the
+        # cached MP3 instead of a multi-second TTS round-trip
+        os.makedirs(AUDIO_CACHE_DIR, exist_ok=True)
+        digest = hashlib.sha256(text.encode()).hexdigest()
+        filename = os.path.join(AUDIO_CACHE_DIR, f"{digest}.mp3")
+
+        if os.path.isfile(filename):
+            logger.info(f"Reusing cached Hindi TTS output: {filename}")
+            return filename
+
         # Create TTS output
         tts = gTTS(text=text, lang='hi', slow=False)
         tts.save(filename)
-        
+        prune_audio_cache()
+
         logger.info(f"Generated Hindi TTS output: {filename}")
         return filename
-    
+
     except Exception as e:
         logger.error(f"Error generating Hindi speech: {str(e)}")
         return ""
@@ -385,15 +697,15 @@ def process_company_news(company_name: str, num_articles: int = 10) -> Dict[str,
         # Step 1: Extract news articles
         articles = extract_news_articles(company_name, num_articles)
         
-        # Step 2: Process each article
+        # Step 2: Analyze sentiment for all articles in one batched call
+        sentiment_results = analyze_sentiments([a["content"] for a in articles]) if articles else []
+
+        # Step 3: Process each article
         processed_articles = []
-        for article in articles:
-            # Analyze sentiment
-            sentiment_result = analyze_sentiment(article["content"])
-            
+        for article, sentiment_result in zip(articles, sentiment_results):
             # Extract topics
             topics = extract_topics(article["content"])
-            
+
             # Create processed article
             processed_article = {
                 "Title": article["title"],
@@ -404,15 +716,17 @@ def process_company_news(company_name: str, num_articles: int = 10) -> Dict[str,
             }
             processed_articles.append(processed_article)
         
-        # Step 3: Perform comparative analysis
+        # Step 4: Perform comparative analysis
         comparative_analysis = perform_comparative_analysis(processed_articles)
         
-        # Step 4: Create Hindi summary
+        # Step 5: Create Hindi summary
         hindi_summary = create_hindi_summary(company_name, comparative_analysis)
-        
-        # Step 5: Generate Hindi TTS
+
+        # Step 6: Generate Hindi TTS. This depends on the comparative
+        # analysis, so it's the last real work in the pipeline - there is
+        # nothing left to overlap it with
         audio_file = text_to_hindi_speech(hindi_summary)
-        
+
         # Combine all results
         result = {
             "Company": company_name,
@@ -422,7 +736,7 @@ def process_company_news(company_name: str, num_articles: int = 10) -> Dict[str,
             "Hindi Summary": hindi_summary,
             "Audio": audio_file
         }
-        
+
         return result
     
     except Exception as e: